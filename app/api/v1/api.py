@@ -1,9 +1,10 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import shipments, risks, simulations, auth
+from app.api.v1.endpoints import shipments, risks, simulations, auth, dashboard
 
 api_router = APIRouter()
 
 api_router.include_router(shipments.router, prefix="/shipments", tags=["shipments"])
+api_router.include_router(dashboard.router, prefix="/dashboard", tags=["dashboard"])
 api_router.include_router(risks.router, prefix="/risks", tags=["risks"])
 api_router.include_router(simulations.router, prefix="/simulations", tags=["simulations"])
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
\ No newline at end of file
@@ -0,0 +1,52 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
+
+from app.core.database import get_db
+from app.schemas.shipment import ShipmentInDB
+from app.schemas.risk import RiskInDB
+from app.schemas.simulation import SimulationInDB
+from app.services.shipment_service import ShipmentService
+from app.services.risk_service import RiskService
+from app.services.simulation_service import SimulationService
+
+router = APIRouter()
+shipment_service = ShipmentService()
+risk_service = RiskService()
+simulation_service = SimulationService()
+
+class DashboardBundle(BaseModel):
+    shipments: List[ShipmentInDB]
+    risks: List[RiskInDB]
+    simulations: List[SimulationInDB]
+
+@router.get("/bundle", response_model=DashboardBundle)
+async def get_dashboard_bundle(
+    shipment_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """Return shipments, risks and simulations in one payload.
+
+    Collapses the three round-trips the dashboard used to make into a
+    single call. Simulations default to the first shipment when no
+    shipment_id is given, matching the dashboard's behaviour.
+    """
+    shipments = await shipment_service.get_shipments(0, 100, None, None, db)
+    risks = await risk_service.get_risks(
+        skip=0,
+        limit=100,
+        shipment_id=None,
+        status=None,
+        severity=None,
+        session=db,
+    )
+
+    if shipment_id is None and shipments:
+        shipment_id = shipments[0].id
+
+    simulations = []
+    if shipment_id is not None:
+        simulations = await simulation_service.get_shipment_simulations(shipment_id, db)
+
+    return {"shipments": shipments, "risks": risks, "simulations": simulations}
@@ -1,7 +1,8 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import asyncio
+import hashlib
 from app.api.v1.api import api_router
 from app.api.websocket import router as websocket_router
 from app.core.config import settings
@@ -58,6 +59,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ETag revalidation for API reads: hash the response body, and answer a
+# matching If-None-Match with an empty 304 instead of the full JSON. The
+# frontend polls /shipments, /risks and /dashboard/bundle on short TTLs,
+# so unchanged data revalidates in ~200 bytes.
+@app.middleware("http")
+async def etag_middleware(request: Request, call_next):
+    response = await call_next(request)
+    if request.method != "GET" or response.status_code != 200 or not request.url.path.startswith("/api/v1"):
+        return response
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = f'"{hashlib.md5(body).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    headers = dict(response.headers)
+    headers["ETag"] = etag
+    return Response(content=body, status_code=response.status_code, headers=headers, media_type=response.media_type)
+
 # Include routers
 app.include_router(api_router, prefix="/api/v1")
 app.include_router(websocket_router, prefix="/ws")
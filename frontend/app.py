@@ -1,8 +1,7 @@
-import streamlit as st
-import requests
-from utils import is_authenticated
+import pathlib
 
-API_BASE = "http://api:8000/api/v1"
+import streamlit as st
+from utils import fetch_api, is_authenticated
 
 # ---------------- PAGE CONFIG ----------------
 st.set_page_config(
@@ -13,39 +12,13 @@ st.set_page_config(
 )
 
 # ---------------- GLOBAL STYLES ----------------
-st.markdown(
-    """
-    <style>
-        .login-card {
-            background: #ffffff;
-            padding: 32px;
-            border-radius: 16px;
-            box-shadow: 0 12px 32px rgba(0,0,0,0.10);
-            width: 360px;
-            text-align: center;
-        }
-        .login-subtle {
-            font-size: 14px;
-            opacity: 0.6;
-            margin-bottom: 18px;
-        }
-        .image-card {
-            border-radius: 18px;
-            overflow: hidden;
-            box-shadow: 0 10px 28px rgba(0,0,0,0.16);
-            max-width: 620px;
-            margin: 0 auto;
-        }
-        .nav-hint {
-            text-align: center;
-            margin-top: 20px;
-            opacity: 0.75;
-            font-size: 14px;
-        }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+@st.cache_data(show_spinner=False)
+def _load_css() -> str:
+    # read the stylesheet once per process instead of rebuilding the
+    # inline <style> block on every rerun
+    return (pathlib.Path(__file__).parent / "assets" / "login.css").read_text()
+
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
 
 # ---------------- HEADER ----------------
 st.markdown(
@@ -82,13 +55,13 @@ if not is_authenticated():
 
     if st.button("Sign in", use_container_width=True):
         try:
-            resp = requests.post(
-                f"{API_BASE}/auth/login",
-                json={"username": username, "password": password},
+            data = fetch_api(
+                "/auth/login",
+                method="POST",
+                payload={"username": username, "password": password},
                 timeout=10,
             )
-            resp.raise_for_status()
-            token = resp.json().get("access_token")
+            token = (data or {}).get("access_token")
             if token:
                 st.session_state["jwt_token"] = token
                 st.experimental_rerun()
@@ -128,5 +101,6 @@ else:
     st.markdown("<div style='height:24px;'></div>", unsafe_allow_html=True)
 
     if st.button("Sign out", use_container_width=True):
-        st.session_state.pop("jwt_token", None)
+        # drop the whole session (token, cached widget state) in one C-level call
+        st.session_state.clear()
         st.experimental_rerun()
@@ -1,9 +1,26 @@
 # frontend/pages/dashboard.py
 import streamlit as st
 import pandas as pd
-import html
-from datetime import datetime
-from utils import fetch_api, is_authenticated   # ✅ use helpers
+import time
+from collections import Counter
+from utils import fetch_api, inject_page_css, is_authenticated   # ✅ use helpers
+
+# static card markup built once at import — titles/subtitles are literals,
+# so only the integer value is interpolated per render
+_CARD_TMPL = """
+<div style="
+    background: linear-gradient(135deg, #2563EB, #3B82F6);
+    border-radius: 12px;
+    padding: 16px;
+    color: white;
+    box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+    text-align: center;
+">
+    <div style="font-size:14px; font-weight:600; margin-bottom:6px;">{title}</div>
+    <div style="font-size:28px; font-weight:700; margin-bottom:4px;">{value}</div>
+    <div style="font-size:12px; opacity:0.9;">{sub}</div>
+</div>
+"""
 
 # ---------------- PAGE CONFIG ----------------
 st.set_page_config(
@@ -12,45 +29,82 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded",
 )
+inject_page_css()
+
+@st.cache_data(show_spinner=False)
+def records_df(records) -> pd.DataFrame:
+    # DataFrame construction from list-of-dicts does dtype inference on
+    # every call; cache it so reruns with the same payload reuse the frame
+    df = pd.DataFrame(records)
+    # low-cardinality label columns as category: equality tests and
+    # value_counts become integer-code ops instead of object-string compares
+    for col in ("status", "severity"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    return df
+
+# the bulk shipment payload carries many more fields than the overview
+# renders; projecting to these before pd.DataFrame keeps column storage
+# and dtype inference proportional to what is actually shown
+_OVERVIEW_COLS = ("id", "tracking_number", "origin", "destination", "status", "mode", "is_at_risk", "risk_score", "estimated_arrival")
 
-def styled_table_html(df: pd.DataFrame, table_id: str = None):
-    html_table = df.to_html(classes="premium-table", index=False, justify="left", border=0, escape=True)
-    if table_id:
-        html_table = html_table.replace('class="premium-table"', f'class="premium-table" id="{table_id}"')
-    wrapper = f'<div class="premium-table-wrapper">{html_table}</div>'
-    return wrapper
+@st.cache_data(show_spinner=False)
+def overview_df(records) -> pd.DataFrame:
+    rows = [{k: r.get(k) for k in _OVERVIEW_COLS} for r in records]
+    df = pd.DataFrame(rows, columns=list(_OVERVIEW_COLS))
+    df["status"] = df["status"].astype("category")
+    return df
+
+@st.cache_data(ttl=60, show_spinner=False)
+def severity_counts(risks) -> dict:
+    # single pass over the payload — no DataFrame needed just to count
+    if not risks:
+        return {}
+    return dict(Counter(r.get("severity", "unknown") for r in risks))
+
+@st.cache_data(ttl=30, show_spinner=False)
+def get_bundle():
+    # shipments + risks + first-shipment simulations in one round trip;
+    # the 30 s TTL keeps widget interactions off the network entirely
+    return fetch_api("/dashboard/bundle")
 
 # ---------------- FETCH DASHBOARD DATA ----------------
-shipments = fetch_api("/shipments") if is_authenticated() else None
-risks = fetch_api("/risks") if is_authenticated() else None
+authed = is_authenticated()
+bundle = get_bundle() if authed else None
+shipments = bundle["shipments"] if bundle else None
+risks = bundle["risks"] if bundle else None
+simulations = bundle["simulations"] if bundle else None
 
-# ✅ simulations must be fetched per shipment, not globally
-simulations = None
-if is_authenticated() and shipments:
-    # take the first shipment for dashboard context
-    first_id = shipments[0]["id"]
-    simulations = fetch_api(f"/simulations/shipment/{first_id}")
+if st.sidebar.button("🔄 Refresh data", use_container_width=True):
+    get_bundle.clear()
+    st.experimental_rerun()
 
 # ---------------- HEADER ----------------
-st.markdown("<h1 style='margin-bottom:6px;'>📊 Autonomous Control Tower — Dashboard</h1>", unsafe_allow_html=True)
-st.markdown("<div style='height:6px; width:220px; border-radius:6px; background: linear-gradient(90deg,#2563EB,#3B82F6); margin-bottom:16px;'></div>", unsafe_allow_html=True)
+st.markdown(
+    "<h1 style='margin-bottom:6px;'>📊 Autonomous Control Tower — Dashboard</h1>"
+    "<div style='height:6px; width:220px; border-radius:6px; background: linear-gradient(90deg,#2563EB,#3B82F6); margin-bottom:16px;'></div>",
+    unsafe_allow_html=True,
+)
 
-tabs = st.tabs(["Overview", "Risks", "Simulations"])
+# st.tabs runs every tab body on every rerun; a radio + if/elif means only
+# the visible section builds its DataFrames and HTML
+active_tab = st.radio("View", ["Overview", "Risks", "Simulations"], horizontal=True, label_visibility="collapsed")
 # ---------------- TAB 1: OVERVIEW ----------------
-with tabs[0]:
+if active_tab == "Overview":
     st.subheader("Overview")
 
-    if not is_authenticated():
+    if not authed:
         st.info("Sign in to view dashboard data")
     else:
         if shipments:
-            df_shipments = pd.DataFrame(shipments)
+            df_shipments = overview_df(shipments)
+            # one value_counts pass instead of three boolean-mask slices
+            status_counts = df_shipments['status'].value_counts()
             total = len(df_shipments)
-            at_risk = len(df_shipments[df_shipments['is_at_risk'] == True])
-            delayed = len(df_shipments[df_shipments['status'] == 'delayed'])
-            arrived = len(df_shipments[df_shipments['status'] == 'arrived'])
+            at_risk = int(df_shipments['is_at_risk'].sum())
+            delayed = int(status_counts.get('delayed', 0))
+            arrived = int(status_counts.get('arrived', 0))
 
-            cols = st.columns(4)
             metrics = [
                 ("Total Shipments", total, "Total rows returned"),
                 ("At Risk", at_risk, "High / Critical risk"),
@@ -58,56 +112,49 @@ with tabs[0]:
                 ("Arrived", arrived, "Status = Arrived")
             ]
 
-            for col, (title, value, sub) in zip(cols, metrics):
-                col.markdown(
-                    f"""
-                    <div style="
-                        background: linear-gradient(135deg, #2563EB, #3B82F6);
-                        border-radius: 12px;
-                        padding: 16px;
-                        color: white;
-                        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-                        text-align: center;
-                        margin-bottom: 12px;
-                    ">
-                        <div style="font-size:14px; font-weight:600; margin-bottom:6px;">{html.escape(title)}</div>
-                        <div style="font-size:28px; font-weight:700; margin-bottom:4px;">{html.escape(str(value))}</div>
-                        <div style="font-size:12px; opacity:0.9;">{html.escape(sub)}</div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
+            # one markdown call + CSS grid instead of st.columns(4) + 4 markdowns
+            cards = "".join(
+                _CARD_TMPL.format(title=title, value=int(value), sub=sub)
+                for title, value, sub in metrics
+            )
+            st.markdown(
+                f'<div style="display:grid; grid-template-columns:repeat(4,1fr); gap:16px; margin-bottom:12px;">{cards}</div>',
+                unsafe_allow_html=True,
+            )
 
         if shipments:
             st.markdown("<h4 style='margin-top:10px;'>🚢 Shipments</h4>", unsafe_allow_html=True)
-            st.markdown(styled_table_html(pd.DataFrame(shipments), table_id="dashboard-shipments"), unsafe_allow_html=True)
+            st.dataframe(df_shipments, use_container_width=True, hide_index=True)
 
 # ---------------- TAB 2: RISKS ----------------
-with tabs[1]:
+elif active_tab == "Risks":
     st.subheader("Risks")
 
-    if not is_authenticated():
+    if not authed:
         st.info("Sign in to view risks")
     else:
         if risks:
-            df_risks = pd.DataFrame(risks)
-            st.markdown(styled_table_html(df_risks, table_id="dashboard-risks"), unsafe_allow_html=True)
+            counts = severity_counts(risks)
+            if counts:
+                st.caption(" • ".join(f"{severity}: {count}" for severity, count in counts.items()))
+            df_risks = records_df(risks)
+            st.dataframe(df_risks, use_container_width=True, hide_index=True)
         else:
             st.info("No risks data available.")
 
 # ---------------- TAB 3: SIMULATIONS ----------------
-with tabs[2]:
+elif active_tab == "Simulations":
     st.subheader("Simulations")
 
-    if not is_authenticated():
+    if not authed:
         st.info("Sign in to view simulations")
     else:
         if simulations:
-            df_sims = pd.DataFrame(simulations)
-            st.markdown(styled_table_html(df_sims, table_id="dashboard-simulations"), unsafe_allow_html=True)
+            df_sims = records_df(simulations)
+            st.dataframe(df_sims, use_container_width=True, hide_index=True)
         else:
             st.info("No simulations data available.")
 
 # ---------------- FOOTER ----------------
 st.markdown("<hr/>", unsafe_allow_html=True)
-st.caption(f"Autonomous Control Tower — Dashboard Module • Last updated {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+st.caption(f"Autonomous Control Tower — Dashboard Module • Last updated {time.strftime('%Y-%m-%d %H:%M:%S')}")
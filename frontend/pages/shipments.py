@@ -1,9 +1,11 @@
 # frontend/pages/shipments.py
 import streamlit as st
+import numpy as np
 import pandas as pd
 import html
+import time
 from datetime import datetime, timedelta
-from utils import fetch_api, is_authenticated   # ✅ use helpers
+from utils import fetch_api, inject_page_css, is_authenticated, styled_table_html   # ✅ use helpers
 
 # ---------------- PAGE CONFIG ----------------
 st.set_page_config(
@@ -12,42 +14,144 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded",
 )
+inject_page_css()
 
-def styled_table_html(df: pd.DataFrame, table_id: str = None):
-    html_table = df.to_html(classes="premium-table", index=False, justify="left", border=0, escape=True)
-    if table_id:
-        html_table = html_table.replace('class="premium-table"', f'class="premium-table" id="{table_id}"')
-    wrapper = f'<div class="premium-table-wrapper">{html_table}</div>'
-    return wrapper
+# static card markup built once at import — titles/subtitles are literals,
+# so only the integer value is interpolated per render
+_CARD_TMPL = """
+<div style="
+    background: linear-gradient(135deg, #6D28D9, #8B5CF6);
+    border-radius: 12px;
+    padding: 16px;
+    color: white;
+    box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+    text-align: center;
+">
+    <div style="font-size:14px; font-weight:600; margin-bottom:6px;">{title}</div>
+    <div style="font-size:28px; font-weight:700; margin-bottom:4px;">{value}</div>
+    <div style="font-size:12px; opacity:0.9;">{sub}</div>
+</div>
+"""
+
+@st.cache_data(ttl=30, show_spinner=False)
+def load_shipments():
+    # one bulk fetch per TTL window instead of one per rerun; cleared
+    # explicitly after a successful create so the new row shows up at once
+    return fetch_api("/shipments")
+
+@st.cache_data(show_spinner=False)
+def shipments_frame(shipments) -> pd.DataFrame:
+    df = pd.DataFrame(shipments)
+    # short repeated labels as category: the status equality filter and
+    # KPI counts compare integer codes instead of object strings
+    for col in ("status", "mode"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    if "id" in df.columns:
+        # id-indexed (drop=False keeps the column visible in tables) so
+        # any by-id row access is a direct .loc instead of a boolean scan
+        df = df.set_index("id", drop=False)
+    return df
+
+@st.cache_data(ttl=120, show_spinner=False)
+def shipment_details(shipment_id):
+    # keyed per shipment so widget reruns reuse the cached detail payload
+    return fetch_api(f"/shipments/{shipment_id}")
+
+@st.cache_data(ttl=60, show_spinner=False)
+def shipment_simulations(shipment_id):
+    # keyed on the selected shipment id so reruns triggered by unrelated
+    # widgets reuse the cached payload instead of re-hitting the API
+    return fetch_api(f"/simulations/shipment/{shipment_id}")
+
+@st.cache_data(show_spinner=False)
+def status_options(df: pd.DataFrame) -> list:
+    # unique+sort is O(n log n) per call; memoize so the selectbox options
+    # are recomputed only when the shipments frame actually changes
+    return ["All"] + sorted(df["status"].dropna().unique().tolist())
+
+@st.cache_data(show_spinner=False)
+def id_options(df: pd.DataFrame) -> list:
+    return df.index.tolist()
+
+@st.cache_data(show_spinner=False)
+def search_haystack(df: pd.DataFrame) -> pd.Series:
+    # the concatenated lowercase search column depends only on the frame,
+    # so build it once per frame instead of once per distinct query
+    return (
+        df["tracking_number"].astype(str) + "|"
+        + df["origin"].astype(str) + "|"
+        + df["destination"].astype(str)
+    ).str.lower()
+
+@st.cache_data(show_spinner=False)
+def filter_shipments(df: pd.DataFrame, status: str, query: str) -> pd.DataFrame:
+    # memoized on (frame, filters): reruns from unrelated widgets skip the
+    # mask build and string scan entirely
+    if status == "All" and not query:
+        return df
+    # one flat bool ndarray — no per-condition Series allocation or index
+    # alignment, and a single gather at the end
+    mask = np.ones(len(df), dtype=bool)
+    if status != "All":
+        mask &= (df["status"] == status).values
+    if query:
+        mask &= search_haystack(df).str.contains(query.lower(), regex=False, na=False).values
+    return df.iloc[mask]
+
+@st.cache_data(show_spinner=False)
+def escaped_fields(shipment: dict) -> dict:
+    # escape every scalar field once per selection; reruns reuse the dict
+    return {k: html.escape(str(v)) for k, v in shipment.items() if not isinstance(v, (list, dict))}
 # ---------------- FETCH SHIPMENTS ----------------
-shipments = fetch_api("/shipments") if is_authenticated() else None
-if shipments:
-    df_shipments = pd.DataFrame(shipments)
-    st.session_state.shipments = df_shipments
-else:
-    st.session_state.shipments = pd.DataFrame()
+authed = is_authenticated()
+shipments = load_shipments() if authed else None
+st.session_state.shipments = shipments_frame(shipments) if shipments else pd.DataFrame()
 
 # ---------------- HEADER ----------------
-st.markdown("<h1 style='margin-bottom:6px;'>🚢 Autonomous Control Tower — Shipments</h1>", unsafe_allow_html=True)
-st.markdown("<div style='height:6px; width:220px; border-radius:6px; background: linear-gradient(90deg,#6D28D9,#8B5CF6); margin-bottom:16px;'></div>", unsafe_allow_html=True)
+st.markdown(
+    "<h1 style='margin-bottom:6px;'>🚢 Autonomous Control Tower — Shipments</h1>"
+    "<div style='height:6px; width:220px; border-radius:6px; background: linear-gradient(90deg,#6D28D9,#8B5CF6); margin-bottom:16px;'></div>",
+    unsafe_allow_html=True,
+)
 
-tabs = st.tabs(["All Shipments", "Create Shipment", "Shipment Details"])
+# st.tabs runs every tab body on every rerun — the details tab would hit
+# the API even while the user edits the create form; a radio + if/elif
+# runs only the visible section
+active_tab = st.radio("View", ["All Shipments", "Create Shipment", "Shipment Details"], horizontal=True, label_visibility="collapsed")
 # ---------------- TAB 1: ALL SHIPMENTS ----------------
-with tabs[0]:
+if active_tab == "All Shipments":
     st.subheader("All Shipments")
     if st.session_state.shipments.empty:
         st.info("No shipments available.")
     else:
-        df_all = st.session_state.shipments.copy()
-        st.markdown(styled_table_html(df_all, table_id="all-shipments"), unsafe_allow_html=True)
+        # read-only from here on — no copy needed; an unchanged reference
+        # also keeps the cache keys of the helpers below stable
+        df_all = st.session_state.shipments
+
+        # search/status filter — literal substring match (regex=False) and
+        # one combined boolean mask instead of per-column regex scans;
+        # wrapped in a form so typing doesn't refilter on every keystroke
+        with st.form("shipment_filters"):
+            f1, f2 = st.columns([3, 1])
+            search_term = f1.text_input("Search", placeholder="Tracking number, origin or destination")
+            status_filter = f2.selectbox("Status Filter", status_options(df_all))
+            st.form_submit_button("Apply Filters", use_container_width=True)
+
+        df_view = filter_shipments(df_all, status_filter, search_term)
+
+        # Arrow-backed virtualized grid: frontend work scales with visible
+        # rows, not total rows, unlike a monolithic HTML table
+        st.dataframe(df_view, use_container_width=True, hide_index=True)
 
-        # KPI metrics
+        # KPI metrics — mask sums and one value_counts pass instead of
+        # slicing an intermediate frame per stat
         total = len(df_all)
-        at_risk = len(df_all[df_all['is_at_risk'] == True])
-        delayed = len(df_all[df_all['status'] == 'delayed'])
-        arrived = len(df_all[df_all['status'] == 'arrived'])
+        at_risk = int(df_all['is_at_risk'].sum())
+        status_counts = df_all['status'].value_counts()
+        delayed = int(status_counts.get('delayed', 0))
+        arrived = int(status_counts.get('arrived', 0))
 
-        cols = st.columns(4)
         metrics = [
             ("Total Shipments", total, "Total rows returned"),
             ("At Risk", at_risk, "High / Critical risk"),
@@ -55,29 +159,20 @@ with tabs[0]:
             ("Arrived", arrived, "Status = Arrived")
         ]
 
-        for col, (title, value, sub) in zip(cols, metrics):
-            col.markdown(
-                f"""
-                <div style="
-                    background: linear-gradient(135deg, #6D28D9, #8B5CF6);
-                    border-radius: 12px;
-                    padding: 16px;
-                    color: white;
-                    box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-                    text-align: center;
-                    margin-bottom: 12px;
-                ">
-                    <div style="font-size:14px; font-weight:600; margin-bottom:6px;">{html.escape(title)}</div>
-                    <div style="font-size:28px; font-weight:700; margin-bottom:4px;">{html.escape(str(value))}</div>
-                    <div style="font-size:12px; opacity:0.9;">{html.escape(sub)}</div>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
+        # one markdown call + CSS grid instead of st.columns(4) + 4 markdowns
+        cards = "".join(
+            _CARD_TMPL.format(title=title, value=int(value), sub=sub)
+            for title, value, sub in metrics
+        )
+        st.markdown(
+            f'<div style="display:grid; grid-template-columns:repeat(4,1fr); gap:16px; margin-bottom:12px;">{cards}</div>',
+            unsafe_allow_html=True,
+        )
 
 # ---------------- TAB 2: CREATE SHIPMENT ----------------
-with tabs[1]:
+elif active_tab == "Create Shipment":
     st.subheader("Create New Shipment")
+    now = datetime.now()   # one clock read per render pass
     with st.form("create_shipment_form", clear_on_submit=False):
         c1, c2 = st.columns(2)
         with c1:
@@ -88,11 +183,11 @@ with tabs[1]:
             mode = st.selectbox("Mode", ["air", "sea", "rail", "multimodal"])
         with c2:
             status = st.selectbox("Status", ["pending", "in_transit", "delayed", "arrived"])
-            eta = st.date_input("ETA", datetime.now() + timedelta(days=10))
+            eta = st.date_input("ETA", now + timedelta(days=10))
             value = st.text_input("Value", "100000")
         submitted = st.form_submit_button("Create Shipment", use_container_width=True)
 
-    if submitted and is_authenticated():
+    if submitted and authed:
         # Validate required fields
         missing = []
         for name, val in [("tracking_number", tracking), ("origin", origin), ("destination", destination), ("mode", mode)]:
@@ -104,8 +199,7 @@ with tabs[1]:
         else:
             # build a naive datetime for estimated_arrival (no tzinfo) to match backend DB expectations
             try:
-                _dt = datetime
-                est_dt = _dt.combine(eta, _dt.utcnow().time())
+                est_dt = datetime.combine(eta, datetime.utcnow().time())
             except Exception:
                 est_dt = None
 
@@ -128,35 +222,39 @@ with tabs[1]:
         resp = fetch_api("/shipments", method="POST", payload=payload)
         if resp:
             st.success(f"Shipment {resp['id']} created successfully.")
+            load_shipments.clear()   # next rerun refetches and includes the new row
     elif submitted:
         st.warning("Please sign in to create shipments")
 # ---------------- TAB 3: SHIPMENT DETAILS ----------------
-with tabs[2]:
+elif active_tab == "Shipment Details":
     st.subheader("Shipment Details")
     if st.session_state.shipments.empty:
         st.info("No shipments available. Create one in the 'Create Shipment' tab.")
     else:
-        sel_id = st.selectbox("Select Shipment ID", st.session_state.shipments["id"].tolist(), index=0)
-        shipment = fetch_api(f"/shipments/{sel_id}") if is_authenticated() else None
+        sel_id = st.selectbox("Select Shipment ID", id_options(st.session_state.shipments), index=0)
+        # the bulk /shipments payload serializes without the risks relation,
+        # so details always come from the (cached) per-shipment endpoint
+        shipment = shipment_details(sel_id) if authed else None
         if shipment:
+            e = escaped_fields(shipment)
             # Gradient card with core shipment info
             st.markdown(
                 f"""
                 <div class="shipment-detail-card">
                     <div style="display:flex;justify-content:space-between;align-items:center;flex-wrap:wrap;">
                         <div style="min-width:220px;">
-                            <div class="shipment-detail-title">Shipment {html.escape(str(shipment['id']))}</div>
-                            <div class="shipment-detail-meta">{html.escape(shipment['origin'])} → {html.escape(shipment['destination'])}</div>
+                            <div class="shipment-detail-title">Shipment {e['id']}</div>
+                            <div class="shipment-detail-meta">{e['origin']} → {e['destination']}</div>
                             <div style="margin-top:8px;">
-                                <span class="shipment-metric">Status: {html.escape(shipment['status'])}</span>
-                                <span class="shipment-metric">Mode: {html.escape(shipment['mode'])}</span>
-                                <span class="shipment-metric">ETA: {html.escape(str(shipment.get('estimated_arrival','N/A')))}</span>
+                                <span class="shipment-metric">Status: {e['status']}</span>
+                                <span class="shipment-metric">Mode: {e['mode']}</span>
+                                <span class="shipment-metric">ETA: {e.get('estimated_arrival', 'N/A')}</span>
                             </div>
                         </div>
                         <div style="min-width:240px;text-align:right;">
                             <div style="font-weight:800;font-size:1.0rem;">Risk Score</div>
-                            <div style="margin-top:8px;font-weight:800;font-size:1.6rem;">{html.escape(str(shipment.get('risk_score','0.0')))}</div>
-                            <div style="margin-top:8px;font-size:0.9rem;opacity:0.95;">Tracking: {html.escape(shipment['tracking_number'])}</div>
+                            <div style="margin-top:8px;font-weight:800;font-size:1.6rem;">{e.get('risk_score', '0.0')}</div>
+                            <div style="margin-top:8px;font-size:0.9rem;opacity:0.95;">Tracking: {e['tracking_number']}</div>
                         </div>
                     </div>
                 </div>
@@ -171,8 +269,8 @@ with tabs[2]:
                 st.markdown(styled_table_html(risk_df, table_id="risk-table"), unsafe_allow_html=True)
 
             # Simulations
-            if is_authenticated():
-                simulations = fetch_api(f"/simulations/shipment/{sel_id}")
+            if authed:
+                simulations = shipment_simulations(sel_id)
                 if simulations:
                     st.markdown("<h4 style='margin-top:6px;'>🔮 Simulations</h4>", unsafe_allow_html=True)
                     for sim in simulations:
@@ -185,7 +283,7 @@ with tabs[2]:
             ab1, ab2 = st.columns(2)
             with ab1:
                 if st.button("🔄 Trigger Risk Check", use_container_width=True):
-                    if is_authenticated():
+                    if authed:
                         payload = {
                             "shipment_id": sel_id,
                             "simulation_type": "mitigation_analysis",   # ✅ valid enum
@@ -199,7 +297,7 @@ with tabs[2]:
                         st.warning("Please sign in to trigger risk checks")
             with ab2:
                 if st.button("📊 Run Mitigation Simulation", use_container_width=True):
-                    if is_authenticated():
+                    if authed:
                         payload = {"shipment_id": sel_id, "risk_data": {"risk_type": "PORT_CONGESTION"}}
                         resp = fetch_api("/simulations/mitigation/run", method="POST", payload=payload)
                         if resp:
@@ -208,4 +306,4 @@ with tabs[2]:
                         st.warning("Please sign in to run simulations")
 # ---------------- FOOTER ----------------
 st.markdown("<hr/>", unsafe_allow_html=True)
-st.caption(f"Autonomous Control Tower — Shipments Module • Last updated {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+st.caption(f"Autonomous Control Tower — Shipments Module • Last updated {time.strftime('%Y-%m-%d %H:%M:%S')}")
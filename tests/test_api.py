@@ -266,6 +266,62 @@ class TestSimulationsAPI:
         assert "rerun" in data["message"].lower()
         assert simulation_id == data["simulation_id"]
 
+class TestDashboardEndpoints:
+    """Test dashboard bundle endpoint"""
+
+    def setup_method(self):
+        """Setup test database"""
+        Base.metadata.create_all(bind=engine)
+
+    def teardown_method(self):
+        """Cleanup test database"""
+        Base.metadata.drop_all(bind=engine)
+
+    def test_bundle_empty_db(self):
+        """Test bundle returns empty lists when nothing is seeded"""
+        response = client.get("/api/v1/dashboard/bundle")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["shipments"] == []
+        assert data["risks"] == []
+        assert data["simulations"] == []
+
+    def test_bundle_defaults_to_first_shipment_simulations(self):
+        """Test simulations default to the first shipment when shipment_id is omitted"""
+        first = client.post("/api/v1/shipments/", json=test_shipment_data).json()
+        second_shipment = test_shipment_data.copy()
+        second_shipment["tracking_number"] = "TEST67890"
+        second = client.post("/api/v1/shipments/", json=second_shipment).json()
+
+        # One simulation per shipment so the default is distinguishable
+        for shipment in (first, second):
+            simulation = test_simulation_data.copy()
+            simulation["shipment_id"] = shipment["id"]
+            client.post("/api/v1/simulations/", json=simulation)
+
+        response = client.get("/api/v1/dashboard/bundle")
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["shipments"]) == 2
+        assert len(data["simulations"]) > 0
+        assert all(s["shipment_id"] == first["id"] for s in data["simulations"])
+
+    def test_bundle_explicit_shipment_id(self):
+        """Test simulations follow an explicit shipment_id"""
+        first = client.post("/api/v1/shipments/", json=test_shipment_data).json()
+        second_shipment = test_shipment_data.copy()
+        second_shipment["tracking_number"] = "TEST67890"
+        second = client.post("/api/v1/shipments/", json=second_shipment).json()
+
+        simulation = test_simulation_data.copy()
+        simulation["shipment_id"] = second["id"]
+        client.post("/api/v1/simulations/", json=simulation)
+
+        response = client.get(f"/api/v1/dashboard/bundle?shipment_id={second['id']}")
+        assert response.status_code == 200
+        data = response.json()
+        assert all(s["shipment_id"] == second["id"] for s in data["simulations"])
+
 class TestHealthAPI:
     """Test health check endpoints"""
     